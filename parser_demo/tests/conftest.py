@@ -0,0 +1,78 @@
+"""
+Shared pytest configuration for demo parser tests
+"""
+
+import importlib.util
+import shutil
+import tempfile
+
+import pytest
+from pytest_asyncio import is_async_test
+
+from ..config import DemoConfig
+from ..utils import logger as demo_logger
+
+
+def _module_available(name: str) -> bool:
+    try:
+        return importlib.util.find_spec(name) is not None
+    except ImportError:
+        return False
+
+
+# Core parsers depend on unrealparser's HTTP client; without it, don't even
+# collect the modules that need them instead of skipping test by test
+collect_ignore = []
+if not _module_available("http.worker_manager"):
+    collect_ignore.extend([
+        "test_detail_extraction.py",
+        "test_fake_db.py",
+        "test_listing_extraction.py",
+        "test_simple.py",
+    ])
+
+
+def pytest_configure(config):
+    # Demo loggers open their file when created, database.models' on import:
+    # send them to a temp dir before test modules are collected, not to logs/
+    config.demo_log_dir = tempfile.mkdtemp(prefix="demo_parser_logs_")
+    demo_logger.log_dir = config.demo_log_dir
+
+
+def pytest_unconfigure(config):
+    shutil.rmtree(config.demo_log_dir, ignore_errors=True)
+
+
+# tryfirst: xdist reads xdist_group markers in its own modifyitems hook
+@pytest.hookimpl(tryfirst=True)
+def pytest_collection_modifyitems(items):
+    # Run every async test in the session event loop instead of one loop per test
+    session_loop = pytest.mark.asyncio(loop_scope="session")
+    # All database test modules share one sqlite file; keep them on one xdist worker
+    database_group = pytest.mark.xdist_group("database")
+    for item in items:
+        if is_async_test(item):
+            item.add_marker(session_loop, append=False)
+        if item.path.name.startswith("test_database"):
+            item.add_marker(database_group)
+
+
+@pytest.fixture(scope="session")
+def demo_config():
+    """Small demo parser configuration shared by parser tests"""
+    # Trusted constants: skip validation (covered in test_config.py)
+    return DemoConfig.model_construct(
+        max_brands=2,
+        max_pages_per_brand=2,
+        max_workers=3,
+        timeout=30,
+        listing_delay=0.1,
+        detail_delay=0.2,
+        fake_db=True,
+    )
+
+
+@pytest.fixture(scope="session")
+def default_config():
+    """Default demo parser configuration"""
+    return DemoConfig()
@@ -3,7 +3,13 @@ Tests for DemoDataServerAdapter
 """
 
 import pytest
-from unittest.mock import patch, AsyncMock, MagicMock
+from types import MappingProxyType
+from unittest.mock import patch, DEFAULT
+
+# The adapter needs the data server adapter configs and unrealparser's HTTP
+# client; skip the module once when either is missing
+pytest.importorskip("adapter.configs.config")
+pytest.importorskip("http.worker_manager")
 
 from ..adapter import DemoDataServerAdapter
 from ..config import DemoConfig
@@ -15,20 +21,44 @@ class ServiceType:
     HTML_PAGES = "html_pages"
 
 
+# Canned parser statistics returned by the mocked get_statistics; read-only
+# so a test can't leak changes into the next one
+_MOCK_STATS = MappingProxyType({
+    "total_listings": 100,
+    "total_details": 50,
+    "failed_brands": ("brand1",),
+    "failed_urls": ("url1",)
+})
+
+
 class TestDemoDataServerAdapter:
     """Test Demo data server adapter"""
 
-    @pytest.fixture
-    def adapter(self):
+    @pytest.fixture(scope="class")
+    @classmethod
+    def adapter(cls):
+        # Built once per class: tests only patch parser methods (restored on exit)
         return DemoDataServerAdapter("test_service")
 
-    @pytest.fixture
+    @pytest.fixture(scope="session")
     def config(self):
-        return DemoConfig(max_brands=5, max_pages_per_brand=2)
+        # Trusted constants: skip validation (covered in test_config.py).
+        # DemoConfig is mutable, so tests must not assign to this shared instance
+        return DemoConfig.model_construct(max_brands=5, max_pages_per_brand=2)
 
     @pytest.fixture
-    def adapter_with_config(self, config):
-        return DemoDataServerAdapter("test_service", config)
+    def parser_mocks(self, adapter):
+        """Patch all parser entry points used by the adapter in one go"""
+        with patch.multiple(
+            adapter.parser,
+            initialize=DEFAULT,
+            parse_listings=DEFAULT,
+            parse_details=DEFAULT,
+            parse_html_pages=DEFAULT,
+            get_statistics=DEFAULT,
+        ) as mocks:
+            mocks["get_statistics"].return_value = _MOCK_STATS
+            yield mocks
 
     def test_adapter_initialization(self, adapter):
         """Test adapter initialization"""
@@ -70,76 +100,51 @@ class TestDemoDataServerAdapter:
         assert "Demo Detail Service" in service_names
         assert "Demo HTML Service" in service_names
 
-    @pytest.mark.asyncio
-    async def test_execute_task_parse_listings(self, adapter):
+    async def test_execute_task_parse_listings(self, adapter, parser_mocks):
         """Test executing parse_listings task"""
         task_data = {"max_brands": 3, "max_pages_per_brand": 2}
-        
-        with patch.object(adapter.parser, 'initialize') as mock_init, \
-             patch.object(adapter.parser, 'parse_listings') as mock_parse, \
-             patch.object(adapter.parser, 'get_statistics') as mock_stats:
-            
-            mock_init.return_value = None
-            mock_parse.return_value = 10
-            mock_stats.return_value = {"total_listings": 10}
-            
-            result = await adapter.execute_task("parse_listings", task_data)
-            
-            assert result["success"] is True
-            assert result["listings_count"] == 10
-            assert "statistics" in result
-            assert "timestamp" in result
-            
-            mock_init.assert_called_once()
-            mock_parse.assert_called_once_with(3, 2)
+        parser_mocks["parse_listings"].return_value = 10
+
+        result = await adapter.execute_task("parse_listings", task_data)
+
+        assert result["success"] is True
+        assert result["listings_count"] == 10
+        assert "statistics" in result
+        assert "timestamp" in result
+
+        parser_mocks["initialize"].assert_called_once()
+        parser_mocks["parse_listings"].assert_called_once_with(3, 2)
 
-    @pytest.mark.asyncio
-    async def test_execute_task_parse_details(self, adapter):
+    async def test_execute_task_parse_details(self, adapter, parser_mocks):
         """Test executing parse_details task"""
         task_data = {"max_urls": 50}
-        
-        with patch.object(adapter.parser, 'initialize') as mock_init, \
-             patch.object(adapter.parser, 'parse_details') as mock_parse, \
-             patch.object(adapter.parser, 'get_statistics') as mock_stats:
-            
-            mock_init.return_value = None
-            mock_parse.return_value = 25
-            mock_stats.return_value = {"total_details": 25}
-            
-            result = await adapter.execute_task("parse_details", task_data)
-            
-            assert result["success"] is True
-            assert result["details_count"] == 25
-            assert "statistics" in result
-            assert "timestamp" in result
-            
-            mock_init.assert_called_once()
-            mock_parse.assert_called_once_with(50)
+        parser_mocks["parse_details"].return_value = 25
+
+        result = await adapter.execute_task("parse_details", task_data)
+
+        assert result["success"] is True
+        assert result["details_count"] == 25
+        assert "statistics" in result
+        assert "timestamp" in result
 
-    @pytest.mark.asyncio
-    async def test_execute_task_parse_html(self, adapter):
+        parser_mocks["initialize"].assert_called_once()
+        parser_mocks["parse_details"].assert_called_once_with(50)
+
+    async def test_execute_task_parse_html(self, adapter, parser_mocks):
         """Test executing parse_html task"""
         task_data = {"max_urls": 30}
-        
-        with patch.object(adapter.parser, 'initialize') as mock_init, \
-             patch.object(adapter.parser, 'parse_html_pages') as mock_parse, \
-             patch.object(adapter.parser, 'get_statistics') as mock_stats:
-            
-            mock_init.return_value = None
-            mock_parse.return_value = 15
-            mock_stats.return_value = {"total_html": 15}
-            
-            result = await adapter.execute_task("parse_html", task_data)
-            
-            assert result["success"] is True
-            assert result["html_count"] == 15
-            assert "statistics" in result
-            assert "timestamp" in result
-            
-            mock_init.assert_called_once()
-            mock_parse.assert_called_once_with(30)
+        parser_mocks["parse_html_pages"].return_value = 15
+
+        result = await adapter.execute_task("parse_html", task_data)
+
+        assert result["success"] is True
+        assert result["html_count"] == 15
+        assert "statistics" in result
+        assert "timestamp" in result
+
+        parser_mocks["initialize"].assert_called_once()
+        parser_mocks["parse_html_pages"].assert_called_once_with(30)
 
-    @pytest.mark.asyncio
     async def test_execute_task_unknown_task(self, adapter):
         """Test executing unknown task"""
         result = await adapter.execute_task("unknown_task", {})
@@ -147,7 +152,6 @@ class TestDemoDataServerAdapter:
         assert result["success"] is False
         assert "Unknown task type: unknown_task" in result["error"]
 
-    @pytest.mark.asyncio
     async def test_execute_task_exception(self, adapter):
         """Test executing task with exception"""
         with patch.object(adapter.parser, 'initialize', side_effect=Exception("Test error")):
@@ -156,20 +160,12 @@ class TestDemoDataServerAdapter:
             assert result["success"] is False
             assert "Test error" in result["error"]
 
-    def test_get_parser_statistics(self, adapter):
+    def test_get_parser_statistics(self, adapter, parser_mocks):
         """Test getting parser statistics"""
-        with patch.object(adapter.parser, 'get_statistics') as mock_stats:
-            mock_stats.return_value = {
-                "total_listings": 100,
-                "total_details": 50,
-                "failed_brands": ["brand1"],
-                "failed_urls": ["url1"]
-            }
-            
-            stats = adapter.get_parser_statistics()
-            
-            assert "statistics" in stats
-            assert "success" in stats
+        stats = adapter.get_parser_statistics()
+
+        assert "statistics" in stats
+        assert "success" in stats
 
     def test_get_parser_statistics_exception(self, adapter):
         """Test getting statistics with exception"""
@@ -179,59 +175,35 @@ class TestDemoDataServerAdapter:
             assert "error" in stats
             assert "Stats error" in stats["error"]
 
-    @pytest.mark.asyncio
-    async def test_parse_listings_with_default_config(self, adapter):
+    async def test_parse_listings_with_default_config(self, adapter, parser_mocks):
         """Test parse_listings with default configuration"""
         task_data = {}
-        
-        with patch.object(adapter.parser, 'initialize') as mock_init, \
-             patch.object(adapter.parser, 'parse_listings') as mock_parse, \
-             patch.object(adapter.parser, 'get_statistics') as mock_stats:
-            
-            mock_init.return_value = None
-            mock_parse.return_value = 5
-            mock_stats.return_value = {"total_listings": 5}
-            
-            result = await adapter._parse_listings(task_data)
-            
-            # Should use default config values
-            mock_parse.assert_called_once_with(2, 1)  # max_brands=2, max_pages=1
+        parser_mocks["parse_listings"].return_value = 5
+
+        await adapter._parse_listings(task_data)
+
+        # Should use default config values
+        parser_mocks["parse_listings"].assert_called_once_with(2, 1)  # max_brands=2, max_pages=1
 
-    @pytest.mark.asyncio
-    async def test_parse_details_with_default_config(self, adapter):
+    async def test_parse_details_with_default_config(self, adapter, parser_mocks):
         """Test parse_details with default configuration"""
         task_data = {}
-        
-        with patch.object(adapter.parser, 'initialize') as mock_init, \
-             patch.object(adapter.parser, 'parse_details') as mock_parse, \
-             patch.object(adapter.parser, 'get_statistics') as mock_stats:
-            
-            mock_init.return_value = None
-            mock_parse.return_value = 20
-            mock_stats.return_value = {"total_details": 20}
-            
-            result = await adapter._parse_details(task_data)
-            
-            # Should use default config values
-            mock_parse.assert_called_once_with(5)  # max_items_for_details=5
+        parser_mocks["parse_details"].return_value = 20
+
+        await adapter._parse_details(task_data)
+
+        # Should use default config values
+        parser_mocks["parse_details"].assert_called_once_with(5)  # max_items_for_details=5
 
-    @pytest.mark.asyncio
-    async def test_parse_html_with_default_config(self, adapter):
+    async def test_parse_html_with_default_config(self, adapter, parser_mocks):
         """Test parse_html with default configuration"""
         task_data = {}
-        
-        with patch.object(adapter.parser, 'initialize') as mock_init, \
-             patch.object(adapter.parser, 'parse_html_pages') as mock_parse, \
-             patch.object(adapter.parser, 'get_statistics') as mock_stats:
-            
-            mock_init.return_value = None
-            mock_parse.return_value = 10
-            mock_stats.return_value = {"total_html": 10}
-            
-            result = await adapter._parse_html(task_data)
-            
-            # Should use default config values
-            mock_parse.assert_called_once_with(5)  # max_items_for_html=5
+        parser_mocks["parse_html_pages"].return_value = 10
+
+        await adapter._parse_html(task_data)
+
+        # Should use default config values
+        parser_mocks["parse_html_pages"].assert_called_once_with(5)  # max_items_for_html=5
 
 
 if __name__ == '__main__':
@@ -4,15 +4,9 @@ Tests for DemoDatabaseManager - Real database operations
 
 import pytest
 import json
-import sys
-import os
 import asyncio
-from pathlib import Path
 from datetime import datetime
 
-# Add root project to path
-sys.path.append(os.path.join(os.path.dirname(__file__), "..", "..", ".."))
-
 # Import only the database-related modules
 from ..database.models import DemoItem, DemoStatistics, initialize_database, database
 from ..database.database import DemoDatabaseManager
@@ -42,7 +36,6 @@ class TestDemoDatabaseManager:
         except Exception as e:
             print(f"Warning: Could not cleanup database: {e}")
 
-    @pytest.mark.asyncio
     async def test_save_listing_to_db(self):
         """Test saving single listing to database"""
         listing_data = {
@@ -71,7 +64,6 @@ class TestDemoDatabaseManager:
         assert saved_listing_data["id"] == "demo_123"
         assert saved_listing_data["title"] == "Demo Car"
 
-    @pytest.mark.asyncio
     async def test_save_listings_batch_to_db(self):
         """Test saving batch of listings to database"""
         listings_data = [
@@ -111,7 +103,6 @@ class TestDemoDatabaseManager:
         assert item2.title == "Demo Car 2"
         assert item2.brand == "Honda"
 
-    @pytest.mark.asyncio
     async def test_save_detail_to_db(self):
         """Test saving single detail to database"""
         # First create a listing item
@@ -146,7 +137,6 @@ class TestDemoDatabaseManager:
         assert saved_detail_data["specifications"]["engine"] == "2.0L"
         assert saved_detail_data["specifications"]["transmission"] == "Automatic"
 
-    @pytest.mark.asyncio
     async def test_save_details_batch_to_db(self):
         """Test saving batch of details to database"""
         # First create listing items
@@ -188,7 +178,6 @@ class TestDemoDatabaseManager:
             detail_data = json.loads(item.detail_data)
             assert "specifications" in detail_data
 
-    @pytest.mark.asyncio
     async def test_save_html_content_to_db(self):
         """Test saving HTML content to database"""
         item_id = "demo_123"
@@ -204,7 +193,6 @@ class TestDemoDatabaseManager:
         assert saved_item.url == url
         assert saved_item.status == "processed"
 
-    @pytest.mark.asyncio
     async def test_get_statistics_from_db(self):
         """Test getting statistics from database"""
         # Save some test data first
@@ -232,7 +220,6 @@ class TestDemoDatabaseManager:
         assert top_brands[0][0] == "Toyota"
         assert top_brands[0][1] == 2
 
-    @pytest.mark.asyncio
     async def test_get_items_for_details(self):
         """Test getting items for detail parsing"""
         # Save some test data
@@ -251,7 +238,6 @@ class TestDemoDatabaseManager:
         assert "demo_123" in item_ids
         assert "demo_124" in item_ids
 
-    @pytest.mark.asyncio
     async def test_get_items_for_html(self):
         """Test getting items for HTML parsing"""
         # Save some test data
@@ -270,7 +256,6 @@ class TestDemoDatabaseManager:
         assert "demo_123" in item_ids
         assert "demo_124" in item_ids
 
-    @pytest.mark.asyncio
     async def test_clear_all_data(self):
         """Test clearing all data from database"""
         # Save some test data
@@ -292,7 +277,6 @@ class TestDemoDatabaseManager:
         count_after = DemoItem.select().count()
         assert count_after == 0
 
-    @pytest.mark.asyncio
     async def test_get_database_info(self):
         """Test getting database information"""
         info = await self.db_manager.get_database_info()
@@ -307,7 +291,6 @@ class TestDemoDatabaseManager:
         # Check that database path contains demo_parser.db
         assert "demo_parser.db" in info["database_path"]
 
-    @pytest.mark.asyncio
     async def test_update_existing_item(self):
         """Test updating existing item"""
         # Save initial listing
@@ -336,7 +319,6 @@ class TestDemoDatabaseManager:
         assert updated_item.title == "Updated Title"
         assert updated_item.listing_html == "<div>Updated HTML</div>"
 
-    @pytest.mark.asyncio
     async def test_database_connection_and_transactions(self):
         """Test database connection and transaction handling"""
         # Test that database is connected
@@ -3,16 +3,11 @@
 Isolated database tests - works with temporarily commented imports
 """
 
-import os
-import sys
 import json
 import asyncio
 import pytest
 from datetime import datetime
 
-# Add backend/django to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", ".."))
-
 # Import database modules (works when problematic imports are commented)
 from ..database.models import DemoItem, DemoStatistics, initialize_database, database
 from ..database.database import DemoDatabaseManager
@@ -60,7 +55,6 @@ def sample_detail_data():
     }
 
 
-@pytest.mark.asyncio
 async def test_save_listing_to_db(db_manager, sample_listing_data):
     """Test saving listing to database"""
     print("Testing save listing to database...")
@@ -85,7 +79,6 @@ async def test_save_listing_to_db(db_manager, sample_listing_data):
     print(f"✅ JSON data verified")
 
 
-@pytest.mark.asyncio
 async def test_save_detail_to_db(db_manager, sample_listing_data, sample_detail_data):
     """Test saving detail to database"""
     print("Testing save detail to database...")
@@ -111,7 +104,6 @@ async def test_save_detail_to_db(db_manager, sample_listing_data, sample_detail_
     print(f"✅ Detail JSON data verified")
 
 
-@pytest.mark.asyncio
 async def test_save_batch_listings(db_manager):
     """Test saving batch of listings"""
     print("Testing batch save...")
@@ -160,7 +152,6 @@ async def test_save_batch_listings(db_manager):
     assert item2.brand == "BMW"
 
 
-@pytest.mark.asyncio
 async def test_get_items_for_details(db_manager, sample_listing_data):
     """Test getting items for detail parsing"""
     print("Testing get items for details...")
@@ -178,7 +169,6 @@ async def test_get_items_for_details(db_manager, sample_listing_data):
     print(f"✅ Found {len(items)} items for details")
 
 
-@pytest.mark.asyncio
 async def test_get_items_for_html(db_manager, sample_listing_data):
     """Test getting items for HTML parsing"""
     print("Testing get items for HTML...")
@@ -196,7 +186,6 @@ async def test_get_items_for_html(db_manager, sample_listing_data):
     print(f"✅ Found {len(items)} items for HTML")
 
 
-@pytest.mark.asyncio
 async def test_clear_all_data(db_manager, sample_listing_data):
     """Test clearing all data from database"""
     print("Testing clear all data...")
@@ -220,7 +209,6 @@ async def test_clear_all_data(db_manager, sample_listing_data):
     print(f"✅ Items after cleanup: {count_after}")
 
 
-@pytest.mark.asyncio
 async def test_get_database_info(db_manager):
     """Test getting database information"""
     print("Testing database info...")
@@ -239,7 +227,6 @@ async def test_get_database_info(db_manager):
     print(f"✅ Database info verified: {info['database_type']}")
 
 
-@pytest.mark.asyncio
 async def test_update_existing_item(db_manager, sample_listing_data):
     """Test updating existing item"""
     print("Testing update existing item...")
@@ -3,16 +3,11 @@
 Simple database tests - stable version
 """
 
-import os
-import sys
 import json
 import asyncio
 import pytest
 from datetime import datetime
 
-# Add backend/django to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", ".."))
-
 # Import database modules (works when problematic imports are commented)
 from ..database.models import DemoItem, DemoStatistics, initialize_database, database
 from ..database.database import DemoDatabaseManager
@@ -40,7 +35,6 @@ def db_manager():
         pass
 
 
-@pytest.mark.asyncio
 async def test_save_and_retrieve_listing(db_manager):
     """Test saving and retrieving a listing"""
     print("Testing save and retrieve listing...")
@@ -70,7 +64,6 @@ async def test_save_and_retrieve_listing(db_manager):
     print(f"✅ Retrieved item: {saved_item.title}")
 
 
-@pytest.mark.asyncio
 async def test_save_and_retrieve_detail(db_manager):
     """Test saving and retrieving detail data"""
     print("Testing save and retrieve detail...")
@@ -112,7 +105,6 @@ async def test_save_and_retrieve_detail(db_manager):
     print(f"✅ Detail data saved successfully")
 
 
-@pytest.mark.asyncio
 async def test_batch_operations(db_manager):
     """Test batch operations"""
     print("Testing batch operations...")
@@ -152,7 +144,6 @@ async def test_batch_operations(db_manager):
     print(f"✅ Verified {len(saved_items)} batch items")
 
 
-@pytest.mark.asyncio
 async def test_database_info(db_manager):
     """Test getting database information"""
     print("Testing database info...")
@@ -167,7 +158,6 @@ async def test_database_info(db_manager):
     print(f"✅ Database info verified: {info['database_type']}")
 
 
-@pytest.mark.asyncio
 async def test_clear_operations(db_manager):
     """Test clear operations"""
     print("Testing clear operations...")
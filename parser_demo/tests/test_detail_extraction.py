@@ -3,13 +3,11 @@ Tests for Demo Detail Extraction
 """
 
 import pytest
-import sys
-import os
+from types import MappingProxyType
 from unittest.mock import patch, AsyncMock, MagicMock
-from pathlib import Path
 
-# Add root project to path
-sys.path.append(os.path.join(os.path.dirname(__file__), "..", "..", ".."))
+# Core parsers depend on unrealparser's HTTP client; skip the module without it
+pytest.importorskip("http.worker_manager")
 
 from ..core.detail_parser.extractor import DemoDetailExtractor
 from ..core.detail_parser.parser import DemoDetailParser
@@ -17,6 +15,18 @@ from ..core.detail_parser.saver import DemoDetailSaver
 from ..config import DemoConfig
 
 
+# Detail saved by the saver tests; read-only because the saver annotates the
+# dict it is given, so each test saves a copy
+_DETAIL_DATA = MappingProxyType({
+    "url": "https://demo-cars.com/dealer/dealer123/car456.html",
+    "car_id": "car456",
+    "brand": "Toyota",
+    "model": "Camry"
+})
+_PAGE_HTML = "<div>Demo detail HTML</div>"
+
+
+@pytest.mark.xdist_group("html_extract")
 class TestDemoDetailExtractor:
     """Test DemoDetailExtractor class"""
 
@@ -220,22 +230,24 @@ class TestDemoDetailExtractor:
 
 
 
+@pytest.mark.xdist_group("detail_parser")
 class TestDemoDetailParser:
     """Test DemoDetailParser class"""
 
-    def setup_method(self):
-        """Setup test method"""
-        self.config = DemoConfig(max_items_for_details=10)
-        self.parser = DemoDetailParser("test_service", self.config)
+    @pytest.fixture(scope="class")
+    @classmethod
+    def parser(cls):
+        # fake_db keeps the saver in memory, away from the shared sqlite file
+        config = DemoConfig.model_construct(max_items_for_details=10, fake_db=True)
+        return DemoDetailParser("test_service", config)
 
-    @pytest.mark.asyncio
-    async def test_parse_single_detail(self):
+    def test_parse_single_detail(self, parser):
         """Test parsing single detail page"""
         url = "https://demo.com/car/123"
         html_content = "<div>Car detail HTML</div>"
         
-        with patch.object(self.parser.extractor, 'extract_detail') as mock_extract, \
-             patch.object(self.parser.saver, 'save_details') as mock_save:
+        with patch.object(parser.extractor, 'extract_detail') as mock_extract, \
+             patch.object(parser.saver, 'save_details') as mock_save:
             
             mock_extract.return_value = (
                 {
@@ -250,28 +262,24 @@ class TestDemoDetailParser:
             )
             
             # Test the extractor directly
-            detail_data, page_html = self.parser.extractor.extract_detail(html_content, url)
+            detail_data, page_html = parser.extractor.extract_detail(html_content, url)
             
             assert detail_data is not None
             assert page_html is not None
 
-    @pytest.mark.asyncio
-    async def test_parse_single_detail_exception(self):
+    def test_parse_single_detail_exception(self, parser):
         """Test parsing single detail with exception"""
         url = "https://demo.com/car/123"
         html_content = "<div>Car detail HTML</div>"
         
-        # Test that extractor handles exceptions gracefully
-        try:
-            detail_data, page_html = self.parser.extractor.extract_detail(html_content, url)
-            assert detail_data is not None
-            assert page_html is not None
-        except Exception as e:
-            # If exception is raised, it should be handled by the extractor
-            assert "extraction" in str(e).lower() or "error" in str(e).lower()
+        # Extractor handles generation errors itself and returns fallback data
+        with patch.object(parser.extractor, '_generate_detail_data', side_effect=ValueError("Test error")):
+            detail_data, page_html = parser.extractor.extract_detail(html_content, url)
+
+        assert detail_data == {"url": url, "source": "demo"}
+        assert "Error generating detail" in page_html
 
-    @pytest.mark.asyncio
-    async def test_parse_details_batch(self):
+    def test_parse_details_batch(self, parser):
         """Test parsing batch of details"""
         items = [
             {"id": "car1", "url": "https://demo.com/car/1"},
@@ -280,44 +288,19 @@ class TestDemoDetailParser:
         
         # Test the extractor directly for each item
         for item in items:
-            detail_data, page_html = self.parser.extractor.extract_detail("", item["url"])
+            detail_data, page_html = parser.extractor.extract_detail("", item["url"])
             assert detail_data is not None
             assert page_html is not None
 
-    @pytest.mark.asyncio
-    async def test_parse_details_batch_partial_failure(self):
-        """Test parsing batch with partial failures"""
-        items = [
-            {"id": "car1", "url": "https://demo.com/car/1"},
-            {"id": "car2", "url": "https://demo.com/car/2"}
-        ]
-        
-        # Test the extractor directly for each item
-        for item in items:
-            detail_data, page_html = self.parser.extractor.extract_detail("", item["url"])
-            assert detail_data is not None
-            assert page_html is not None
+    def test_required_attributes(self, parser):
+        """Test that parser exposes the components used to parse details"""
+        expected = {"extractor", "saver", "get_statistics"}
+        missing = expected - set(dir(parser))
+        assert not missing, f"Missing attributes: {missing}"
 
-    @pytest.mark.asyncio
-    async def test_parse_details_from_database(self):
-        """Test parsing details from database"""
-        # Test that parser has required attributes
-        assert hasattr(self.parser, 'extractor')
-        assert hasattr(self.parser, 'saver')
-        assert hasattr(self.parser, 'get_statistics')
-
-    @pytest.mark.asyncio
-    async def test_parse_details_from_database_empty(self):
-        """Test parsing details from empty database"""
-        # Test that parser has required attributes
-        assert hasattr(self.parser, 'extractor')
-        assert hasattr(self.parser, 'saver')
-        assert hasattr(self.parser, 'get_statistics')
-
-    @pytest.mark.asyncio
-    async def test_get_statistics(self):
+    def test_get_statistics(self, parser):
         """Test getting parser statistics"""
-        stats = self.parser.get_statistics()
+        stats = parser.get_statistics()
         
         assert isinstance(stats, dict)
         assert "total_details" in stats
@@ -326,64 +309,50 @@ class TestDemoDetailParser:
         assert "duration" in stats
 
 
+@pytest.mark.xdist_group("detail_saver")
 class TestDemoDetailSaver:
     """Test DemoDetailSaver class"""
 
-    def setup_method(self):
-        """Setup test method"""
-        self.saver = DemoDetailSaver(use_database=False, fake_db=True)
+    @pytest.fixture(scope="class")
+    @classmethod
+    def saver(cls):
+        return DemoDetailSaver(use_database=False, fake_db=True)
 
-    @pytest.mark.asyncio
-    async def test_save_detail(self):
+    async def test_save_detail(self, saver):
         """Test saving single detail"""
-        detail_data = {
-            "url": "https://demo-cars.com/dealer/dealer123/car456.html",
-            "car_id": "car456",
-            "brand": "Toyota",
-            "model": "Camry"
-        }
-        page_html = "<div>Demo detail HTML</div>"
-        
-        result = await self.saver.save_detail(detail_data, page_html)
+        detail_data = dict(_DETAIL_DATA)
+
+        result = await saver.save_detail(detail_data, _PAGE_HTML)
         
         assert isinstance(result, bool)
         assert result is True
 
-    @pytest.mark.asyncio
-    async def test_save_details(self):
+    async def test_save_details(self, saver):
         """Test saving details batch"""
         details_data = [
-            ({"url": "https://demo-cars.com/dealer/dealer123/car456.html", "car_id": "car456", "brand": "Toyota", "model": "Camry"}, "<div>Detail 1 HTML</div>"),
+            (dict(_DETAIL_DATA), "<div>Detail 1 HTML</div>"),
             ({"url": "https://demo-cars.com/dealer/dealer456/car789.html", "car_id": "car789", "brand": "Honda", "model": "Civic"}, "<div>Detail 2 HTML</div>")
         ]
         
-        result = await self.saver.save_details(details_data)
+        result = await saver.save_details(details_data)
         
         assert isinstance(result, int)
         assert result == 2
 
-    @pytest.mark.asyncio
-    async def test_save_detail_exception(self):
+    async def test_save_detail_exception(self, saver):
         """Test saving detail with exception"""
-        detail_data = {
-            "url": "https://demo-cars.com/dealer/dealer123/car456.html",
-            "car_id": "car456",
-            "brand": "Toyota",
-            "model": "Camry"
-        }
-        page_html = "<div>Demo detail HTML</div>"
-        
+        detail_data = dict(_DETAIL_DATA)
+
         # Test that the method handles exceptions gracefully
         # This test verifies the method signature and return type
-        result = await self.saver.save_detail(detail_data, page_html)
+        result = await saver.save_detail(detail_data, _PAGE_HTML)
         
         assert isinstance(result, bool)
         assert result is True  # Should succeed in normal case
 
-    @pytest.mark.asyncio
-    async def test_get_statistics(self):
+    def test_get_statistics(self, saver):
         """Test getting saver statistics"""
-        stats = self.saver.get_statistics()
+        stats = saver.get_statistics()
         
         assert isinstance(stats, dict)
         assert "total_details" in stats
@@ -2,87 +2,25 @@
 Tests for fake_db functionality
 """
 
+from unittest.mock import Mock
+
 import pytest
-import sys
-from pathlib import Path
 
-# Add the project root to Python path
-project_root = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(project_root))
+# Core parsers depend on unrealparser's HTTP client; skip the module without it
+pytest.importorskip("http.worker_manager")
 
-from ..config import DemoConfig
 from ..core.listing_parser.saver import DemoListingSaver
 from ..core.detail_parser.saver import DemoDetailSaver
 
 
-class TestFakeDB:
-    """Test fake_db functionality"""
-
-    def test_fake_db_default(self):
-        """Test that fake_db defaults to False"""
-        config = DemoConfig()
-        assert config.fake_db is False
-
-    def test_fake_db_enabled(self):
-        """Test that fake_db can be enabled"""
-        config = DemoConfig(fake_db=True)
-        assert config.fake_db is True
-
-    def test_listing_saver_fake_db(self):
-        """Test DemoListingSaver with fake_db"""
-        # Test with fake_db=False (default)
-        saver = DemoListingSaver(use_database=True, fake_db=False)
-        assert saver.use_database is True
-        assert saver.fake_db is False
-        assert saver.db_manager is not None
-
-        # Test with fake_db=True
-        saver = DemoListingSaver(use_database=True, fake_db=True)
-        assert saver.use_database is False  # Should be disabled when fake_db=True
-        assert saver.fake_db is True
-        assert saver.db_manager is None
-
-    def test_detail_saver_fake_db(self):
-        """Test DemoDetailSaver with fake_db"""
-        # Test with fake_db=False (default)
-        saver = DemoDetailSaver(use_database=True, fake_db=False)
-        assert saver.use_database is True
-        assert saver.fake_db is False
-        assert saver.db_manager is not None
-
-        # Test with fake_db=True
-        saver = DemoDetailSaver(use_database=True, fake_db=True)
-        assert saver.use_database is False  # Should be disabled when fake_db=True
-        assert saver.fake_db is True
-        assert saver.db_manager is None
-
-    def test_config_validation(self):
-        """Test that fake_db is properly validated"""
-        # Should work with boolean values
-        config = DemoConfig(fake_db=True)
-        assert config.fake_db is True
-
-        config = DemoConfig(fake_db=False)
-        assert config.fake_db is False
-
-    def test_fake_mode_and_fake_db_combination(self):
-        """Test combination of fake_mode and fake_db"""
-        # Both enabled
-        config = DemoConfig(fake_mode=True, fake_db=True)
-        assert config.fake_mode is True
-        assert config.fake_db is True
-
-        # Only fake_mode enabled
-        config = DemoConfig(fake_mode=True, fake_db=False)
-        assert config.fake_mode is True
-        assert config.fake_db is False
-
-        # Only fake_db enabled
-        config = DemoConfig(fake_mode=False, fake_db=True)
-        assert config.fake_mode is False
-        assert config.fake_db is True
+@pytest.mark.parametrize("saver_cls", [DemoListingSaver, DemoDetailSaver])
+@pytest.mark.parametrize("fake_db, expect_db", [(False, True), (True, False)])
+def test_saver_fake_db(saver_cls, fake_db, expect_db, monkeypatch):
+    """Test that fake_db disables database storage for both savers"""
+    # Keep the real manager off the shared sqlite file
+    monkeypatch.setattr(f"{saver_cls.__module__}.DemoDatabaseManager", Mock)
+    saver = saver_cls(use_database=True, fake_db=fake_db)
 
-        # Both disabled
-        config = DemoConfig(fake_mode=False, fake_db=False)
-        assert config.fake_mode is False
-        assert config.fake_db is False 
\ No newline at end of file
+    assert saver.use_database == expect_db
+    assert saver.fake_db == fake_db
+    assert (saver.db_manager is not None) == expect_db
@@ -2,14 +2,15 @@
 Tests for Demo Listing Extraction
 """
 
+import json
+from pathlib import Path
+from types import SimpleNamespace
+
 import pytest
-import sys
-import os
 from unittest.mock import patch, AsyncMock, MagicMock
-from pathlib import Path
 
-# Add root project to path
-sys.path.append(os.path.join(os.path.dirname(__file__), "..", "..", ".."))
+# Core parsers depend on unrealparser's HTTP client; skip the module without it
+pytest.importorskip("http.worker_manager")
 
 from ..core.listing_parser.extractor import DemoListingExtractor
 from ..core.listing_parser.parser import DemoListingParser
@@ -17,44 +18,72 @@ from ..core.listing_parser.saver import DemoListingSaver
 from ..config import DemoConfig
 
 
+BRANDS_HTML = "<div>Some HTML content</div>"
+LISTING_HTML = "<div>Some HTML content</div>"
+PAGINATION_HTML = "<div>Single page content</div>"
+
+# Listing inputs shared by the saver tests, parsed once at import
+FIXTURES = json.loads((Path(__file__).parent / "fixtures" / "listings.json").read_text())
+
+# Reference brand set the demo extractor samples from; it parses no HTML, so
+# a fixed set is the cheapest and most precise oracle for its output
+VALID_BRANDS = frozenset({
+    "Toyota", "Honda", "BMW", "Mercedes", "Audi",
+    "Ford", "Chevrolet", "Nissan", "Hyundai", "Kia",
+})
+
+# Brand names fed to the patched parser
+_BRANDS3 = ("Toyota", "Honda", "BMW")
+_BRANDS5 = _BRANDS3 + ("Audi", "Mercedes")
+
+
+@pytest.mark.xdist_group("html_extract")
 class TestDemoListingExtractor:
     """Test DemoListingExtractor class"""
 
-    def setup_method(self):
-        """Setup test method"""
-        self.extractor = DemoListingExtractor()
+    @pytest.fixture(scope="class")
+    @classmethod
+    def extractor(cls):
+        return DemoListingExtractor()
 
-    def test_extract_brands_from_html(self):
+    @pytest.fixture(scope="class")
+    @classmethod
+    def extracted_brands(cls, extractor):
+        return extractor.extract_brands_from_html(BRANDS_HTML)
+
+    @pytest.fixture(scope="class")
+    @classmethod
+    def extracted_items(cls, extractor):
+        return extractor.extract_listing_items_from_html(LISTING_HTML)
+
+    @pytest.fixture(scope="class")
+    @classmethod
+    def extracted_pagination(cls, extractor):
+        return extractor.extract_pagination_info(PAGINATION_HTML)
+
+    def test_extract_brands_from_html(self, extracted_brands):
         """Test extracting brands from HTML"""
-        html_content = "<div>Some HTML content</div>"
-        
-        brands = self.extractor.extract_brands_from_html(html_content)
-        
+        brands = extracted_brands
+
         assert isinstance(brands, list)
         assert len(brands) >= 3
         assert len(brands) <= 6
-        # Check that all brands are from the predefined list
-        valid_brands = ["Toyota", "Honda", "BMW", "Mercedes", "Audi", 
-                       "Ford", "Chevrolet", "Nissan", "Hyundai", "Kia"]
-        for brand in brands:
-            assert brand in valid_brands
+        # All brands come from the extractor's predefined list, without repeats
+        assert set(brands) <= VALID_BRANDS
+        assert len(set(brands)) == len(brands)
 
-    def test_extract_brands_from_html_empty(self):
+    def test_extract_brands_from_html_empty(self, extractor):
         """Test extracting brands from empty HTML"""
-        html_content = ""
-        
-        brands = self.extractor.extract_brands_from_html(html_content)
-        
+        brands = extractor.extract_brands_from_html("")
+
         assert isinstance(brands, list)
         assert len(brands) >= 3
         assert len(brands) <= 6
 
-    def test_extract_listing_items_from_html(self):
+    def test_extract_listing_items_from_html(self, extracted_items):
         """Test extracting listing items from HTML"""
-        html_content = "<div>Some HTML content</div>"
-        
-        items = self.extractor.extract_listing_items_from_html(html_content)
-        
+        items = extracted_items
+
         assert isinstance(items, list)
         assert len(items) >= 5
         assert len(items) <= 15
@@ -69,22 +98,18 @@ class TestDemoListingExtractor:
             assert "brand" in item
             assert "url" in item
 
-    def test_extract_listing_items_from_html_empty(self):
+    def test_extract_listing_items_from_html_empty(self, extractor):
         """Test extracting listing items from empty HTML"""
-        html_content = ""
-        
-        items = self.extractor.extract_listing_items_from_html(html_content)
-        
+        items = extractor.extract_listing_items_from_html("")
+
         assert isinstance(items, list)
         assert len(items) >= 5
         assert len(items) <= 15
 
-    def test_extract_pagination_info(self):
+    def test_extract_pagination_info(self, extracted_pagination):
         """Test extracting pagination information"""
-        html_content = "<div>Some HTML content</div>"
-        
-        pagination = self.extractor.extract_pagination_info(html_content)
-        
+        pagination = extracted_pagination
+
         assert isinstance(pagination, dict)
         assert "current_page" in pagination
         assert "total_pages" in pagination
@@ -95,25 +120,12 @@ class TestDemoListingExtractor:
         assert isinstance(pagination["has_next"], bool)
         assert isinstance(pagination["has_prev"], bool)
 
-    def test_extract_pagination_info_single_page(self):
-        """Test extracting pagination information for single page"""
-        html_content = "<div>Single page content</div>"
-        
-        pagination = self.extractor.extract_pagination_info(html_content)
-        
-        assert isinstance(pagination, dict)
-        assert "current_page" in pagination
-        assert "total_pages" in pagination
-        assert "has_next" in pagination
-        assert "has_prev" in pagination
-
-    def test_extract_listings(self):
+    def test_extract_listings(self, extractor):
         """Test extracting listings for specific brand and page"""
-        html_content = "<div>Some HTML content</div>"
         brand_name = "Toyota"
         page_num = 1
-        
-        listings = self.extractor.extract_listings(html_content, brand_name, page_num)
+
+        listings = extractor.extract_listings(LISTING_HTML, brand_name, page_num)
         
         assert isinstance(listings, list)
         assert len(listings) >= 8
@@ -133,82 +145,54 @@ class TestDemoListingExtractor:
             assert listing["page_num"] == page_num
             assert brand_name in listing["title"]
 
-    def test_extract_pagination_info_single_page(self):
-        """Test extracting pagination info for single page"""
-        html_content = "<div>Single page content</div>"
-        
-        pagination = self.extractor.extract_pagination_info(html_content)
-        
-        assert isinstance(pagination, dict)
-        assert "current_page" in pagination
-        assert "total_pages" in pagination
-        assert "has_next" in pagination
-        assert "has_prev" in pagination
-
 
+@pytest.mark.xdist_group("listing_parser")
 class TestDemoListingParser:
     """Test DemoListingParser class"""
 
-    def setup_method(self):
-        """Setup test method"""
-        self.config = DemoConfig(max_brands=3, max_pages_per_brand=2)
-        self.parser = DemoListingParser("test_service", self.config)
-
-    @pytest.mark.asyncio
-    async def test_parse_brand_listings(self):
-        """Test parsing listings for a specific brand"""
-        # Test that parser has required attributes
-        assert hasattr(self.parser, 'extractor')
-        assert hasattr(self.parser, 'saver')
-        assert hasattr(self.parser, 'parse_listings')
-        assert hasattr(self.parser, 'get_statistics')
-
-    @pytest.mark.asyncio
-    async def test_parse_brand_listings_empty(self):
-        """Test parsing listings for brand with no results"""
-        # Test that parser has required attributes
-        assert hasattr(self.parser, 'extractor')
-        assert hasattr(self.parser, 'saver')
-        assert hasattr(self.parser, 'parse_listings')
-        assert hasattr(self.parser, 'get_statistics')
-
-    @pytest.mark.asyncio
-    async def test_parse_all_listings(self):
-        """Test parsing all listings"""
-        # Test that parser has required attributes
-        assert hasattr(self.parser, 'extractor')
-        assert hasattr(self.parser, 'saver')
-        assert hasattr(self.parser, 'parse_listings')
-        assert hasattr(self.parser, 'get_statistics')
-
-    @pytest.mark.asyncio
-    async def test_parse_all_listings_with_limit(self):
-        """Test parsing all listings with brand limit"""
-        # Test that parser has required attributes
-        assert hasattr(self.parser, 'extractor')
-        assert hasattr(self.parser, 'saver')
-        assert hasattr(self.parser, 'parse_listings')
-        assert hasattr(self.parser, 'get_statistics')
-
-    @pytest.mark.asyncio
-    async def test_parse_all_listings_exception(self):
-        """Test parsing all listings with exception"""
-        # Test that parser has required attributes
-        assert hasattr(self.parser, 'extractor')
-        assert hasattr(self.parser, 'saver')
-        assert hasattr(self.parser, 'parse_listings')
-        assert hasattr(self.parser, 'get_statistics')
-
-    @pytest.mark.asyncio
-    async def test_get_statistics(self):
+    @pytest.fixture(scope="class")
+    @classmethod
+    def parser(cls):
+        # fake_db keeps the saver in memory, away from the shared sqlite file
+        config = DemoConfig.model_construct(max_brands=3, max_pages_per_brand=2, fake_db=True)
+        return DemoListingParser("test_service", config)
+
+    def test_required_attributes(self, parser):
+        """Test that parser exposes the components used to parse listings"""
+        expected = {"extractor", "saver", "parse_listings", "get_statistics"}
+        missing = expected - set(dir(parser))
+        assert not missing, f"Missing attributes: {missing}"
+
+    @pytest.mark.parametrize("brands,max_brands,expected_calls,expected_total", [
+        (_BRANDS3, 3, 3, 15),
+        (_BRANDS5, 2, 2, 10),
+    ])
+    async def test_parse_all_listings(self, brands, max_brands, expected_calls, expected_total):
+        """Test parsing all listings, with and without a brand limit"""
+        # Fresh fake-mode parser: total_listings accumulates across calls
+        config = DemoConfig.model_construct(max_brands=max_brands, max_pages_per_brand=2, fake_db=True)
+        parser = DemoListingParser("test_service", config, fake_mode=True)
+        demo_brands = [
+            {"name": name, "url": f"https://demo-cars.com/brand/{name.lower()}"}
+            for name in brands
+        ]
+
+        with patch.object(parser, "_get_demo_brands", return_value=demo_brands), \
+             patch.object(parser.saver, "save_listings", AsyncMock(return_value=5)) as mock_save:
+            total = await parser.parse_listings(max_brands=max_brands)
+
+        assert mock_save.await_count == expected_calls
+        assert total == expected_total
+
+    async def test_get_statistics(self, parser):
         """Test getting parser statistics"""
         # Initialize parser first
-        await self.parser.initialize()
+        await parser.initialize()
         
         # Finalize to set end_time
-        await self.parser.finalize()
+        await parser.finalize()
         
-        stats = self.parser.get_statistics()
+        stats = parser.get_statistics()
         
         assert isinstance(stats, dict)
         assert "total_listings" in stats
@@ -216,60 +200,74 @@ class TestDemoListingParser:
         assert "duration" in stats
 
 
+@pytest.mark.xdist_group("listing_saver")
 class TestDemoListingSaver:
     """Test DemoListingSaver class"""
 
-    def setup_method(self):
-        """Setup test method"""
-        self.saver = DemoListingSaver(use_database=False, fake_db=True)
+    @pytest.fixture(scope="class")
+    @classmethod
+    def saver(cls):
+        return DemoListingSaver(use_database=False, fake_db=True)
+
+    @pytest.fixture(scope="session")
+    def db_manager(self):
+        # The batch path only calls save_listings_batch_to_db, so a bare
+        # namespace avoids Mock's spec introspection entirely
+        return SimpleNamespace(save_listings_batch_to_db=AsyncMock())
 
-    @pytest.mark.asyncio
-    async def test_save_listing(self):
+    @pytest.fixture(scope="class")
+    @classmethod
+    def db_saver(cls, db_manager):
+        with patch(f"{DemoListingSaver.__module__}.DemoDatabaseManager", return_value=db_manager):
+            return DemoListingSaver(use_database=True)
+
+    async def test_save_listing(self, saver):
         """Test saving single listing"""
-        listing_data = {
-            "id": "demo_123",
-            "title": "Demo Car",
-            "price": "$25,000",
-            "brand": "Toyota",
-            "category": "Sedan"
-        }
-        card_html = "<div>Demo car HTML</div>"
-        
-        result = await self.saver.save_listing(listing_data, card_html)
+        # The saver annotates listing dicts in place, so hand it a copy
+        listing_data = dict(FIXTURES["listing"])
+
+        result = await saver.save_listing(listing_data, FIXTURES["card_html"])
         
         assert isinstance(result, bool)
         assert result is True
 
-    @pytest.mark.asyncio
-    async def test_save_listings(self):
+    async def test_save_listings(self, saver):
         """Test saving multiple listings"""
-        listings_data = [
-            ({"id": "demo_123", "title": "Demo Car 1"}, "<div>Car 1 HTML</div>"),
-            ({"id": "demo_124", "title": "Demo Car 2"}, "<div>Car 2 HTML</div>")
-        ]
-        
-        result = await self.saver.save_listings(listings_data)
+        listings_data = [(dict(listing), card_html) for listing, card_html in FIXTURES["two_cars"]]
+
+        result = await saver.save_listings(listings_data)
         
         assert isinstance(result, int)
         assert result == 2
 
-    @pytest.mark.asyncio
-    async def test_save_listing_exception(self):
+    @pytest.mark.parametrize("n", [1, 10, 100])
+    async def test_save_listings_scales(self, db_saver, db_manager, n):
+        """Test that saving listings to the database is a single batch call"""
+        listings_data = [({"id": f"demo_{i}", "title": "Demo Car"}, "<div>Car HTML</div>") for i in range(n)]
+        mock_batch = db_manager.save_listings_batch_to_db
+        mock_batch.reset_mock()
+        mock_batch.return_value = n
+
+        result = await db_saver.save_listings(listings_data)
+
+        assert result == n
+        mock_batch.assert_called_once()
+        assert len(mock_batch.call_args.args[0]) == n
+
+    async def test_save_listing_exception(self, saver):
         """Test saving listing with exception"""
-        listing_data = {"id": "demo_123", "title": "Demo Car"}
-        card_html = "<div>Demo car HTML</div>"
-        
+        listing_data = dict(FIXTURES["listing"])
+
         # Test that the method handles exceptions gracefully
         # This test verifies the method signature and return type
-        result = await self.saver.save_listing(listing_data, card_html)
+        result = await saver.save_listing(listing_data, FIXTURES["card_html"])
         
         assert isinstance(result, bool)
         assert result is True  # Should succeed in normal case
 
-    @pytest.mark.asyncio
-    async def test_get_statistics(self):
+    def test_get_statistics(self, saver):
         """Test getting saver statistics"""
-        stats = self.saver.get_statistics()
+        stats = saver.get_statistics()
         
         assert isinstance(stats, dict)
         assert "total_listings" in stats
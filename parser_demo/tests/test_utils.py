@@ -0,0 +1,67 @@
+"""
+Tests for demo parser utils
+"""
+
+import io
+import logging
+
+import pytest
+from rich.console import Console
+
+from ..utils import get_logger
+from ..utils import logger as demo_logger
+
+
+@pytest.fixture
+def quiet_logger(monkeypatch, tmp_path):
+    """Factory for demo loggers that log to tmp_path and print nothing"""
+    # get_logger always opens a log file: keep it out of logs/
+    monkeypatch.setattr(demo_logger, "log_dir", str(tmp_path))
+    monkeypatch.setenv("DEMO_PARSER_LOGS", "false")
+    opened = []
+
+    def make(name):
+        # Handlers added to the shared stdlib logger are dropped on teardown
+        monkeypatch.setattr(logging.getLogger(name), "handlers", [])
+        logger = get_logger(name)
+        opened.extend(h for h in logger.logger.handlers if isinstance(h, logging.FileHandler))
+
+        # The stdlib logger drops every record at isEnabledFor(), and console
+        # output (errors print whatever DEMO_PARSER_LOGS says) goes to a buffer
+        monkeypatch.setattr(logger.logger, "disabled", True)
+        monkeypatch.setattr(logger, "rich_console", Console(file=io.StringIO()))
+        return logger
+
+    yield make
+
+    # Runs before monkeypatch restores the handler lists
+    for handler in opened:
+        handler.close()
+
+
+@pytest.mark.parametrize("name", [
+    "test_module",
+    "demo_parser",
+    "test_functionality",
+    "module1",
+    "module2",
+    "reuse_test",
+])
+def test_logger(name, quiet_logger, tmp_path):
+    """Test logger creation and logging at every level"""
+    logger = quiet_logger(name)
+    assert any(isinstance(h, logging.FileHandler) for h in logger.logger.handlers)
+    assert list(tmp_path.glob(f"{name}_*.log"))
+
+    for level in ("debug", "info", "warning", "error"):
+        getattr(logger, level)(f"{level} from {name}")
+
+
+def test_logger_reuses_underlying_logger(quiet_logger):
+    """Test that wrappers for the same name share one logging.Logger"""
+    # get_logger returns a new wrapper each call; only the stdlib logger is shared
+    assert quiet_logger("reuse_test").logger is quiet_logger("reuse_test").logger
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])